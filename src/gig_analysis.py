@@ -0,0 +1,248 @@
+# gig_analysis.py - Single entry point for the analysis pipeline
+#
+# Heavy libraries (pandas, pyarrow, matplotlib, seaborn, praw) are only
+# imported inside the subcommand that needs them, so `--help` and the
+# downloader start instantly.
+import argparse
+import copy
+import glob
+import json
+import os
+import re
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(REPO_ROOT, 'config.json')
+
+# Config keys holding filesystem paths, resolved relative to the repo root
+PATH_SUFFIXES = ('_dir', '_csv', '_json', '_png')
+
+
+def merge_config(base, override):
+    """Recursively merge override into a copy of base"""
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def resolve_paths(config):
+    """Make relative path settings absolute against the repo root"""
+    for key, value in config.items():
+        if isinstance(value, dict):
+            resolve_paths(value)
+        elif key.endswith(PATH_SUFFIXES) and isinstance(value, str):
+            config[key] = os.path.join(REPO_ROOT, value)
+    return config
+
+
+def load_config(path=None):
+    """Load the repo config.json, with an optional override file merged on top"""
+    with open(CONFIG_PATH) as f:
+        config = json.load(f)
+
+    if path is not None:
+        with open(path) as f:
+            config = merge_config(config, json.load(f))
+
+    return resolve_paths(config)
+
+
+def year_month(value):
+    """argparse type for 'YYYY-MM' months"""
+    match = re.fullmatch(r'(\d{4})-(\d{2})', value)
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected YYYY-MM")
+    return value
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid count '{value}', expected a positive integer")
+    return number
+
+
+def cmd_nyc_download(config, args):
+    from tlc_downloader import TLCDownloader, month_range
+
+    nyc = config['nyc']
+    download = nyc['download']
+
+    if args.end and not args.start:
+        args.parser.error("--end requires --start")
+
+    # Command-line months replace the configured list
+    if args.start or args.months:
+        months = list(args.months or [])
+        if args.start:
+            requested = month_range(args.start, args.end or args.start)
+            if not requested:
+                args.parser.error(f"empty month range: {args.start} is after {args.end}")
+            months += requested
+    else:
+        months = list(download['months'])
+    if not months:
+        print("No months to download: give --start/--end, --months or nyc.download.months")
+        return 1
+
+    workers = args.workers if args.workers is not None else download['workers']
+    downloader = TLCDownloader(nyc['data_dir'], download['base_url'], download['dataset'], workers)
+    results = downloader.download_months(sorted(set(months)))
+
+    failed = [m for m, status in results.items() if status == 'failed']
+    if failed:
+        print(f"\n❌ Failed months: {', '.join(sorted(failed))}")
+        return 1
+    print(f"\n✅ All files saved to {nyc['data_dir']}")
+    return 0
+
+
+def cmd_nyc_process(config, args):
+    nyc = config['nyc']
+    if not os.path.isdir(nyc['data_dir']):
+        print(f"❌ Data directory {nyc['data_dir']} not found, run nyc-download first")
+        return 1
+
+    from nyc_tlc_analyzer import NYCTLCAnalyzer, save_final_stats
+
+    analyzer = NYCTLCAnalyzer(
+        nyc['data_dir'],
+        aaa_costs={int(year): cost for year, cost in nyc['aaa_costs'].items()},
+        default_cost_per_mile=nyc['default_cost_per_mile'],
+        chunk_size=nyc['chunk_size'],
+        min_wage=config['min_wage'],
+        min_gross_hourly=nyc['min_gross_hourly'],
+        max_gross_hourly=nyc['max_gross_hourly']
+    )
+
+    print("Starting NYC TLC data analysis (Memory Optimized)...")
+    monthly_results = analyzer.process_all_months(nyc['summaries_csv'], nyc['temp_summaries_csv'],
+                                                  nyc['sample_size'])
+    if monthly_results.empty:
+        print(f"\n❌ No monthly results produced from {nyc['data_dir']}")
+        return 1
+    save_final_stats(monthly_results, nyc['process_stats_json'])
+
+    print("\n✅ Analysis complete! Results saved to:")
+    print(f"   - {nyc['summaries_csv']}")
+    print(f"   - {nyc['process_stats_json']}")
+    return 0
+
+
+def cmd_nyc_report(config, args):
+    if not args.show:
+        # Render without a display when the plot is only saved
+        import matplotlib
+        matplotlib.use('Agg')
+    from analyze_nyc_results import run_report
+
+    nyc = config['nyc']
+    run_report(nyc['summaries_csv'], nyc['report_png'], nyc['report_stats_json'],
+               min_wage=config['min_wage'], reddit_stats=nyc['reddit_reference'], show=args.show)
+    return 0
+
+
+def cmd_reddit_mine(config, args):
+    import reddit_earnings_miner
+
+    reddit = config['reddit']
+    reddit_earnings_miner.main(reddit['output_dir'], reddit['subreddits'], reddit['search_queries'],
+                               reddit['search_limit'], reddit['time_filter'], reddit['request_delay'])
+    return 0
+
+
+def latest_raw_csv(reddit):
+    """Newest mined CSV in output_dir (timestamped names sort chronologically)"""
+    candidates = sorted(glob.glob(os.path.join(reddit['output_dir'], reddit['raw_csv_pattern'])))
+    return candidates[-1] if candidates else None
+
+
+def cmd_reddit_validate(config, args):
+    reddit = config['reddit']
+    raw_csv = latest_raw_csv(reddit)
+    if raw_csv is None:
+        print(f"No mined Reddit data in {reddit['output_dir']}, run reddit-mine first")
+        return 1
+
+    from validate_reddit_data import run_validation
+
+    print(f"Validating {raw_csv}")
+    run_validation(raw_csv, reddit['cleaned_csv'], reddit['summary_json'],
+                   hourly_range=(reddit['min_hourly_rate'], reddit['max_hourly_rate']),
+                   max_hours_worked=reddit['max_hours_worked'], min_wage=config['min_wage'],
+                   low_pay_threshold=reddit['low_pay_threshold'])
+    return 0
+
+
+def cmd_debug(config, args):
+    raw_csv = latest_raw_csv(config['reddit'])
+    if raw_csv is None:
+        print(f"No mined Reddit data in {config['reddit']['output_dir']}, run reddit-mine first")
+        return 1
+
+    from debug_data import debug_reddit_data
+
+    debug = config['debug']
+    print(f"Inspecting {raw_csv}")
+    debug_reddit_data(raw_csv, tuple(debug['weekly_range']),
+                      tuple(debug['hourly_range']))
+    return 0
+
+
+def cmd_config(config, args):
+    print(json.dumps(config, indent=2))
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='gig-analysis',
+                                     description="Gig economy hidden costs analysis pipeline")
+    parser.add_argument('--config', help="JSON file with settings that override config.json")
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    download = subparsers.add_parser('nyc-download', help="Download NYC TLC monthly parquet files")
+    download.add_argument('--start', type=year_month, help="First month (YYYY-MM)")
+    download.add_argument('--end', type=year_month, help="Last month (YYYY-MM), defaults to --start")
+    download.add_argument('--months', nargs='+', type=year_month, help="Explicit months (YYYY-MM)")
+    download.add_argument('--workers', type=positive_int, help="Concurrent downloads")
+    download.set_defaults(func=cmd_nyc_download, parser=download)
+
+    process = subparsers.add_parser('nyc-process', help="Compute monthly NYC TLC earnings summaries")
+    process.set_defaults(func=cmd_nyc_process)
+
+    report = subparsers.add_parser('nyc-report', help="Plot and summarize NYC monthly results")
+    report.add_argument('--show', action='store_true', help="Open the plot window after saving")
+    report.set_defaults(func=cmd_nyc_report)
+
+    mine = subparsers.add_parser('reddit-mine', help="Collect earnings posts from Reddit")
+    mine.set_defaults(func=cmd_reddit_mine)
+
+    validate = subparsers.add_parser('reddit-validate', help="Clean and summarize mined Reddit data")
+    validate.set_defaults(func=cmd_reddit_validate)
+
+    debug = subparsers.add_parser('debug', help="Inspect raw Reddit data for validation issues")
+    debug.set_defaults(func=cmd_debug)
+
+    show_config = subparsers.add_parser('config', help="Print the effective configuration")
+    show_config.set_defaults(func=cmd_config)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config = load_config(args.config)
+    return args.func(config, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,21 +3,20 @@ import pandas as pd
 import pyarrow.parquet as pq
 import numpy as np
 import os
+import json
 from datetime import datetime
 import gc
 
 class NYCTLCAnalyzer:
-    def __init__(self, data_dir):
+    def __init__(self, data_dir, aaa_costs, default_cost_per_mile,
+                 chunk_size, min_wage, min_gross_hourly, max_gross_hourly):
         self.data_dir = data_dir
-        self.aaa_costs = {
-            2019: 0.608,
-            2020: 0.592,
-            2021: 0.608,
-            2022: 0.658,
-            2023: 0.729,
-            2024: 0.816,
-            2025: 0.816
-        }
+        self.aaa_costs = aaa_costs
+        self.default_cost_per_mile = default_cost_per_mile
+        self.chunk_size = chunk_size
+        self.min_wage = min_wage
+        self.min_gross_hourly = min_gross_hourly
+        self.max_gross_hourly = max_gross_hourly
         
     def process_single_month_chunked(self, filepath):
         """Process one month of data in chunks"""
@@ -25,10 +24,10 @@ class NYCTLCAnalyzer:
         
         # Extract year from filename
         year = int(os.path.basename(filepath).split('-')[0].split('_')[-1])
-        cost_per_mile = self.aaa_costs.get(year, 0.75)
+        cost_per_mile = self.aaa_costs.get(year, self.default_cost_per_mile)
         
         # Process in chunks
-        chunk_size = 1_000_000  # 1 million rows at a time
+        chunk_size = self.chunk_size
         monthly_stats = []
         total_below_min = 0
         total_valid_trips = 0
@@ -66,7 +65,8 @@ class NYCTLCAnalyzer:
             chunk['gross_hourly'] = (chunk['driver_pay'] + chunk['tips']) / chunk['trip_hours']
             
             # Filter outliers
-            chunk = chunk[(chunk['gross_hourly'] > 5) & (chunk['gross_hourly'] < 200)]
+            chunk = chunk[(chunk['gross_hourly'] > self.min_gross_hourly) &
+                          (chunk['gross_hourly'] < self.max_gross_hourly)]
             
             # Calculate net
             chunk['trip_cost'] = chunk['trip_miles'] * cost_per_mile
@@ -79,13 +79,13 @@ class NYCTLCAnalyzer:
                     'trips': len(chunk),
                     'gross_hourly_sum': chunk['gross_hourly'].sum(),
                     'net_hourly_sum': chunk['net_hourly'].sum(),
-                    'below_min': (chunk['net_hourly'] < 15).sum(),
+                    'below_min': (chunk['net_hourly'] < self.min_wage).sum(),
                     'miles_sum': chunk['trip_miles'].sum(),
                     'time_sum': chunk['trip_time'].sum(),
                     'tips_sum': chunk['tips'].sum()
                 })
                 
-                total_below_min += (chunk['net_hourly'] < 15).sum()
+                total_below_min += (chunk['net_hourly'] < self.min_wage).sum()
                 total_valid_trips += len(chunk)
             
             # Clear memory
@@ -116,7 +116,7 @@ class NYCTLCAnalyzer:
         
         return summary
     
-    def process_all_months(self):
+    def process_all_months(self, output_csv, temp_csv, sample_size):
         """Process all parquet files"""
         results = []
         
@@ -138,14 +138,14 @@ class NYCTLCAnalyzer:
                     results.append(summary)
                     
                     # Save intermediate results
-                    pd.DataFrame(results).to_csv('nyc_monthly_summaries_temp.csv', index=False)
+                    pd.DataFrame(results).to_csv(temp_csv, index=False)
                     
             except Exception as e:
                 print(f"  Error: {str(e)}")
                 # Try alternative method with sampling
                 try:
                     print(f"  Trying with sampling...")
-                    summary = self.process_with_sampling(filepath)
+                    summary = self.process_with_sampling(filepath, sample_size)
                     if summary:
                         results.append(summary)
                 except Exception as e2:
@@ -154,14 +154,14 @@ class NYCTLCAnalyzer:
         
         # Convert to DataFrame
         results_df = pd.DataFrame(results)
-        results_df.to_csv('nyc_monthly_summaries.csv', index=False)
+        results_df.to_csv(output_csv, index=False)
         
         return results_df
     
-    def process_with_sampling(self, filepath, sample_size=500_000):
+    def process_with_sampling(self, filepath, sample_size):
         """Process with random sampling as fallback"""
         year = int(os.path.basename(filepath).split('-')[0].split('_')[-1])
-        cost_per_mile = self.aaa_costs.get(year, 0.75)
+        cost_per_mile = self.aaa_costs.get(year, self.default_cost_per_mile)
         
         # Read sample
         df = pd.read_parquet(filepath, columns=['trip_time', 'trip_miles', 'driver_pay', 'tips'])
@@ -176,7 +176,7 @@ class NYCTLCAnalyzer:
         
         df['trip_hours'] = df['trip_time'] / 3600
         df['gross_hourly'] = (df['driver_pay'] + df['tips']) / df['trip_hours']
-        df = df[(df['gross_hourly'] > 5) & (df['gross_hourly'] < 200)]
+        df = df[(df['gross_hourly'] > self.min_gross_hourly) & (df['gross_hourly'] < self.max_gross_hourly)]
         
         df['trip_cost'] = df['trip_miles'] * cost_per_mile
         df['net_earnings'] = df['driver_pay'] + df['tips'] - df['trip_cost']
@@ -187,7 +187,7 @@ class NYCTLCAnalyzer:
             'total_trips': len(df),
             'avg_gross_hourly': df['gross_hourly'].mean(),
             'avg_net_hourly': df['net_hourly'].mean(),
-            'pct_below_minimum': (df['net_hourly'] < 15).mean() * 100,
+            'pct_below_minimum': (df['net_hourly'] < self.min_wage).mean() * 100,
             'avg_trip_miles': df['trip_miles'].mean(),
             'avg_trip_time_min': df['trip_time'].mean() / 60,
             'avg_tips': df['tips'].mean(),
@@ -195,18 +195,8 @@ class NYCTLCAnalyzer:
             'is_sample': True
         }
 
-# Main execution continues same as before...
-if __name__ == "__main__":
-    DATA_DIR = "data-processes/NYC-TLC-analysis/data/raw"
-    
-    analyzer = NYCTLCAnalyzer(DATA_DIR)
-    
-    print("Starting NYC TLC data analysis (Memory Optimized)...")
-    monthly_results = analyzer.process_all_months()
-    
-    # Rest of the code remains the same...
-    
-    # Overall statistics
+def save_final_stats(monthly_results, output_json):
+    """Print weighted overall statistics and save them as JSON"""
     print("\n=== OVERALL NYC TLC STATISTICS ===")
     print(f"Total months analyzed: {len(monthly_results)}")
     print(f"Total trips processed: {monthly_results['total_trips'].sum():,}")
@@ -232,10 +222,12 @@ if __name__ == "__main__":
         'date_range': f"{monthly_results['year_month'].min()} to {monthly_results['year_month'].max()}"
     }
     
-    import json
-    with open('nyc_tlc_final_stats.json', 'w') as f:
+    with open(output_json, 'w') as f:
         json.dump(final_stats, f, indent=2)
     
-    print("\n✅ Analysis complete! Results saved to:")
-    print("   - nyc_monthly_summaries.csv")
-    print("   - nyc_tlc_final_stats.json")
\ No newline at end of file
+    return final_stats
+
+if __name__ == "__main__":
+    import sys
+    from gig_analysis import main
+    sys.exit(main(['nyc-process']))
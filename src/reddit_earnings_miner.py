@@ -1,22 +1,14 @@
-import praw
-import pandas as pd
 import re
 from datetime import datetime
 import time
 import os
-from dotenv import load_dotenv
-
-# Load credentials
-load_dotenv()
 
 class RedditGigEconomyMiner:
-    def __init__(self):
-        # Reddit connection
-        self.reddit = praw.Reddit(
-            client_id=os.getenv('CLIENT_ID'),
-            client_secret=os.getenv('CLIENT_SECRET'),
-            user_agent=os.getenv('USER_AGENT')
-        )
+    def __init__(self, time_filter, request_delay):
+        # Reddit connection is created on first use
+        self._reddit = None
+        self.time_filter = time_filter
+        self.request_delay = request_delay
         
         # Data extraction patterns
         self.patterns = {
@@ -66,6 +58,22 @@ class RedditGigEconomyMiner:
         
         return results
     
+    @property
+    def reddit(self):
+        """PRAW client, built from .env credentials on first access"""
+        if self._reddit is None:
+            import praw
+            from dotenv import load_dotenv
+
+            # Load credentials
+            load_dotenv()
+            self._reddit = praw.Reddit(
+                client_id=os.getenv('CLIENT_ID'),
+                client_secret=os.getenv('CLIENT_SECRET'),
+                user_agent=os.getenv('USER_AGENT')
+            )
+        return self._reddit
+    
     def search_and_collect(self, subreddit_name, search_queries, limit=100):
         """Search subreddit and collect relevant posts"""
         print(f"\n🔍 Searching r/{subreddit_name}...")
@@ -77,7 +85,7 @@ class RedditGigEconomyMiner:
             print(f"   Query: '{query}'")
             try:
                 # Search posts
-                posts = subreddit.search(query, time_filter='year', limit=limit)
+                posts = subreddit.search(query, time_filter=self.time_filter, limit=limit)
                 
                 for post in posts:
                     # Combine title and text
@@ -101,7 +109,7 @@ class RedditGigEconomyMiner:
                         print(f"      ✓ Found earnings data in post")
                 
                 # Rate limiting
-                time.sleep(2)
+                time.sleep(self.request_delay)
                 
             except Exception as e:
                 print(f"   ❌ Error with query '{query}': {e}")
@@ -110,28 +118,17 @@ class RedditGigEconomyMiner:
         print(f"   Total posts collected: {len(all_posts)}")
         return all_posts
 
-def main():
+def main(output_dir, subreddits, search_queries, limit, time_filter, request_delay):
+    import pandas as pd
+
     # Initialize miner
-    miner = RedditGigEconomyMiner()
-    
-    # Target subreddits
-    subreddits = ['uberdrivers', 'lyftdrivers', 'doordash_drivers']
-    
-    # Search queries
-    search_queries = [
-        'weekly earnings',
-        'made this week',
-        'income breakdown',
-        'after gas',
-        'net earnings',
-        'hourly rate'
-    ]
+    miner = RedditGigEconomyMiner(time_filter, request_delay)
     
     # Collect data
     all_data = []
     
     for subreddit in subreddits:
-        posts = miner.search_and_collect(subreddit, search_queries, limit=50)
+        posts = miner.search_and_collect(subreddit, search_queries, limit=limit)
         all_data.extend(posts)
     
     # Convert to DataFrame
@@ -139,12 +136,14 @@ def main():
     
     # Save to files
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    csv_path = os.path.join(output_dir, f'reddit_earnings_data_{timestamp}.csv')
+    xlsx_path = os.path.join(output_dir, f'reddit_earnings_data_{timestamp}.xlsx')
     
     # Save as CSV
-    df.to_csv(f'reddit_earnings_data_{timestamp}.csv', index=False)
+    df.to_csv(csv_path, index=False)
     
     # Save as Excel with formatting
-    with pd.ExcelWriter(f'reddit_earnings_data_{timestamp}.xlsx') as writer:
+    with pd.ExcelWriter(xlsx_path) as writer:
         df.to_excel(writer, sheet_name='Raw Data', index=False)
         
         # Summary statistics
@@ -164,7 +163,10 @@ def main():
     
     print(f"\n✅ Data collection complete!")
     print(f"📊 Total posts collected: {len(df)}")
-    print(f"💾 Saved to: reddit_earnings_data_{timestamp}.csv")
+    print(f"💾 Saved to: {csv_path}")
+    return csv_path
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import sys
+    from gig_analysis import main as cli_main
+    sys.exit(cli_main(['reddit-mine']))
\ No newline at end of file
@@ -0,0 +1,180 @@
+# tlc_downloader.py - Parallel, resumable NYC TLC parquet downloader
+import http.client
+import os
+import struct
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+PARQUET_MAGIC = b'PAR1'
+
+
+def month_range(start, end):
+    """Return every 'YYYY-MM' month from start to end (inclusive)"""
+    start_year, start_month = (int(part) for part in start.split('-'))
+    end_year, end_month = (int(part) for part in end.split('-'))
+
+    months = []
+    year, month = start_year, start_month
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year}-{month:02d}")
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return months
+
+
+def verify_parquet(filepath, expected_size=None):
+    """Check file size and parquet header/footer magic bytes"""
+    size = os.path.getsize(filepath)
+    if expected_size is not None and size != expected_size:
+        return False
+    # Smallest valid file: header magic + footer length + footer magic
+    if size < 12:
+        return False
+
+    with open(filepath, 'rb') as f:
+        header = f.read(4)
+        f.seek(-8, os.SEEK_END)
+        footer_len = struct.unpack('<I', f.read(4))[0]
+        footer_magic = f.read(4)
+
+    return (header == PARQUET_MAGIC and footer_magic == PARQUET_MAGIC
+            and footer_len <= size - 12)
+
+
+class TLCDownloader:
+    def __init__(self, data_dir, base_url, dataset, workers,
+                 chunk_size=1024 * 1024, retries=3, timeout=60, retry_delay=1):
+        self.data_dir = data_dir
+        self.base_url = base_url.rstrip('/')
+        self.dataset = dataset
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+
+    def filename_for(self, year_month):
+        return f"{self.dataset}_{year_month}.parquet"
+
+    def remote_size(self, url):
+        """Get Content-Length with a HEAD request (None if unknown)"""
+        request = urllib.request.Request(url, method='HEAD')
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                length = response.headers.get('Content-Length')
+        except urllib.error.HTTPError:
+            # Server rejects HEAD (e.g. 405), the GET can still go ahead unsized
+            return None
+        return int(length) if length is not None else None
+
+    def _fetch(self, url, part_path, total_size):
+        """Stream url into part_path, resuming from its current size"""
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if total_size is not None and offset > total_size:
+            # Partial file is larger than the remote file, start over
+            os.remove(part_path)
+            offset = 0
+        if total_size is not None and offset == total_size:
+            return
+
+        request = urllib.request.Request(url)
+        if offset > 0:
+            request.add_header('Range', f"bytes={offset}-")
+
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            # Nothing left past the end of the part file, it is already complete
+            if e.code == 416 and offset > 0:
+                return
+            raise
+
+        with response:
+            # Server ignored the range request, rewrite from the beginning
+            mode = 'ab' if offset > 0 and response.status == 206 else 'wb'
+            with open(part_path, mode) as f:
+                while True:
+                    block = response.read(self.chunk_size)
+                    if not block:
+                        break
+                    f.write(block)
+
+    def _wait(self, attempt):
+        """Back off before the next attempt (not after the last one)"""
+        if attempt < self.retries:
+            time.sleep(self.retry_delay * attempt)
+
+    def download_month(self, year_month):
+        """Download one month into data_dir, returning (year_month, status)"""
+        filename = self.filename_for(year_month)
+        url = f"{self.base_url}/{filename}"
+        final_path = os.path.join(self.data_dir, filename)
+        part_path = final_path + '.part'
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                total_size = self.remote_size(url)
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                # Server unreachable, but a verified local copy is still usable
+                if os.path.exists(final_path) and verify_parquet(final_path):
+                    return year_month, 'skipped'
+                print(f"  {filename}: attempt {attempt}/{self.retries} failed ({e})")
+                self._wait(attempt)
+                continue
+
+            # Skip files that are already complete
+            if os.path.exists(final_path) and verify_parquet(final_path, total_size):
+                return year_month, 'skipped'
+
+            try:
+                self._fetch(url, part_path, total_size)
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                print(f"  {filename}: attempt {attempt}/{self.retries} failed ({e})")
+                self._wait(attempt)
+                continue
+
+            # Transfer was cut short, keep the partial file so the next attempt resumes it
+            if total_size is not None and os.path.getsize(part_path) < total_size:
+                print(f"  {filename}: incomplete on attempt {attempt}/{self.retries}, resuming")
+                self._wait(attempt)
+                continue
+
+            if verify_parquet(part_path, total_size):
+                # Atomic rename so the analyzer never sees a half-written file
+                os.replace(part_path, final_path)
+                return year_month, 'downloaded'
+
+            # Full size but corrupt (or oversized), drop it and retry from scratch
+            print(f"  {filename}: verification failed on attempt {attempt}/{self.retries}")
+            os.remove(part_path)
+
+        return year_month, 'failed'
+
+    def download_months(self, months):
+        """Download several months concurrently"""
+        os.makedirs(self.data_dir, exist_ok=True)
+        results = {}
+
+        print(f"Downloading {len(months)} files with {self.workers} workers...")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.download_month, m): m for m in months}
+            for future in as_completed(futures):
+                month = futures[future]
+                try:
+                    _, status = future.result()
+                except Exception as e:
+                    print(f"  Error ({month}): {e}")
+                    status = 'failed'
+                results[month] = status
+                print(f"  [{len(results)}/{len(months)}] {self.filename_for(month)}: {status}")
+
+        return results
+
+
+if __name__ == "__main__":
+    import sys
+    from gig_analysis import main
+    sys.exit(main(['nyc-download'] + sys.argv[1:]))
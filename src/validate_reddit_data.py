@@ -1,8 +1,9 @@
 # validate_reddit_data_fixed.py
 import pandas as pd
 import numpy as np
+import json
 
-def validate_and_clean(df, verbose=True):
+def validate_and_clean(df, hourly_range, max_hours_worked, verbose=True):
     """Fixed validation - don't require weekly_earnings"""
     
     initial_count = len(df)
@@ -17,19 +18,20 @@ def validate_and_clean(df, verbose=True):
     
     # 2. Hourly rate filtresi (ana verimiz bu)
     if 'hourly_rate' in df_clean.columns:
-        # $3-$100 arası kabul et
+        # hourly_range aralığını kabul et (config: reddit.min/max_hourly_rate)
+        low, high = hourly_range
         hourly_mask = (
             df_clean['hourly_rate'].isna() | 
-            ((df_clean['hourly_rate'] >= 3) & (df_clean['hourly_rate'] <= 100))
+            ((df_clean['hourly_rate'] >= low) & (df_clean['hourly_rate'] <= high))
         )
         df_clean = df_clean[hourly_mask]
     
     # 3. Hours worked filtresi
     if 'hours_worked' in df_clean.columns:
-        # 0-100 saat/hafta kabul et
+        # 0-max_hours_worked saat/hafta kabul et
         hours_mask = (
             df_clean['hours_worked'].isna() | 
-            ((df_clean['hours_worked'] > 0) & (df_clean['hours_worked'] <= 100))
+            ((df_clean['hours_worked'] > 0) & (df_clean['hours_worked'] <= max_hours_worked))
         )
         df_clean = df_clean[hours_mask]
     
@@ -64,70 +66,79 @@ def validate_and_clean(df, verbose=True):
     
     return df_clean
 
-# Ana analiz
-df = pd.read_csv('reddit_earnings_data_20250727_193003.csv')
-df_clean = validate_and_clean(df)
+def run_validation(input_csv, cleaned_csv, summary_json, hourly_range, max_hours_worked,
+                   min_wage, low_pay_threshold):
+    """Clean raw Reddit posts, print the analysis and save cleaned data and summary"""
+    # Ana analiz
+    df = pd.read_csv(input_csv)
+    df_clean = validate_and_clean(df, hourly_range, max_hours_worked)
 
-print("\n=== CLEANED DATA ANALYSIS ===")
+    print("\n=== CLEANED DATA ANALYSIS ===")
 
-# Hourly rate analizi (ana metrik)
-if 'hourly_rate' in df_clean.columns:
-    hourly = df_clean['hourly_rate'].dropna()
-    print(f"\nHourly Rate Analysis ({len(hourly)} posts):")
-    print(f"  Average: ${hourly.mean():.2f}/hour")
-    print(f"  Median: ${hourly.median():.2f}/hour")
-    print(f"  Min: ${hourly.min():.2f}")
-    print(f"  Max: ${hourly.max():.2f}")
-    print(f"  Below $15 (NYC min wage): {(hourly < 15).sum()} posts ({(hourly < 15).mean()*100:.1f}%)")
-    print(f"  Below $20: {(hourly < 20).sum()} posts ({(hourly < 20).mean()*100:.1f}%)")
+    # Hourly rate analizi (ana metrik)
+    if 'hourly_rate' in df_clean.columns:
+        hourly = df_clean['hourly_rate'].dropna()
+        print(f"\nHourly Rate Analysis ({len(hourly)} posts):")
+        print(f"  Average: ${hourly.mean():.2f}/hour")
+        print(f"  Median: ${hourly.median():.2f}/hour")
+        print(f"  Min: ${hourly.min():.2f}")
+        print(f"  Max: ${hourly.max():.2f}")
+        print(f"  Below ${min_wage} (NYC min wage): {(hourly < min_wage).sum()} posts ({(hourly < min_wage).mean()*100:.1f}%)")
+        print(f"  Below ${low_pay_threshold}: {(hourly < low_pay_threshold).sum()} posts ({(hourly < low_pay_threshold).mean()*100:.1f}%)")
 
-# Hours worked analizi
-if 'hours_worked' in df_clean.columns:
-    hours = df_clean['hours_worked'].dropna()
-    print(f"\nHours Worked Analysis ({len(hours)} posts):")
-    print(f"  Average: {hours.mean():.1f} hours/week")
-    print(f"  Median: {hours.median():.1f} hours/week")
+    # Hours worked analizi
+    if 'hours_worked' in df_clean.columns:
+        hours = df_clean['hours_worked'].dropna()
+        print(f"\nHours Worked Analysis ({len(hours)} posts):")
+        print(f"  Average: {hours.mean():.1f} hours/week")
+        print(f"  Median: {hours.median():.1f} hours/week")
 
-# Subreddit dağılımı
-print(f"\nSubreddit Distribution:")
-print(df_clean['subreddit'].value_counts())
+    # Subreddit dağılımı
+    print(f"\nSubreddit Distribution:")
+    print(df_clean['subreddit'].value_counts())
 
-# En yüksek ve en düşük hourly rate posts
-if 'hourly_rate' in df_clean.columns:
-    print(f"\nHighest Hourly Rates:")
-    top_earners = df_clean.nlargest(5, 'hourly_rate')[['title', 'hourly_rate', 'subreddit']]
-    for idx, row in top_earners.iterrows():
-        print(f"  ${row['hourly_rate']:.2f}/hr - {row['title'][:60]}...")
-    
-    print(f"\nLowest Hourly Rates:")
-    low_earners = df_clean.nsmallest(5, 'hourly_rate')[['title', 'hourly_rate', 'subreddit']]
-    for idx, row in low_earners.iterrows():
-        print(f"  ${row['hourly_rate']:.2f}/hr - {row['title'][:60]}...")
+    # En yüksek ve en düşük hourly rate posts
+    if 'hourly_rate' in df_clean.columns:
+        print(f"\nHighest Hourly Rates:")
+        top_earners = df_clean.nlargest(5, 'hourly_rate')[['title', 'hourly_rate', 'subreddit']]
+        for idx, row in top_earners.iterrows():
+            print(f"  ${row['hourly_rate']:.2f}/hr - {row['title'][:60]}...")
 
-# Net hourly estimate (if calculated)
-if 'net_hourly_estimate' in df_clean.columns:
-    net = df_clean['net_hourly_estimate'].dropna()
-    if len(net) > 0:
-        print(f"\nEstimated Net Hourly (after gas):")
-        print(f"  Average: ${net.mean():.2f}/hour")
-        print(f"  Below $15: {(net < 15).sum()} posts")
+        print(f"\nLowest Hourly Rates:")
+        low_earners = df_clean.nsmallest(5, 'hourly_rate')[['title', 'hourly_rate', 'subreddit']]
+        for idx, row in low_earners.iterrows():
+            print(f"  ${row['hourly_rate']:.2f}/hr - {row['title'][:60]}...")
 
-# Save cleaned data
-df_clean.to_csv('reddit_earnings_cleaned.csv', index=False)
-print(f"\n✅ Saved {len(df_clean)} cleaned posts to reddit_earnings_cleaned.csv")
+    # Net hourly estimate (if calculated)
+    if 'net_hourly_estimate' in df_clean.columns:
+        net = df_clean['net_hourly_estimate'].dropna()
+        if len(net) > 0:
+            print(f"\nEstimated Net Hourly (after gas):")
+            print(f"  Average: ${net.mean():.2f}/hour")
+            print(f"  Below ${min_wage}: {(net < min_wage).sum()} posts")
 
-# Summary statistics for comparison
-summary_stats = {
-    'total_posts': len(df_clean),
-    'avg_hourly_rate': hourly.mean() if 'hourly_rate' in df_clean.columns else None,
-    'median_hourly_rate': hourly.median() if 'hourly_rate' in df_clean.columns else None,
-    'pct_below_15': (hourly < 15).mean() * 100 if 'hourly_rate' in df_clean.columns else None,
-    'avg_hours_worked': hours.mean() if 'hours_worked' in df_clean.columns else None
-}
+    # Save cleaned data
+    df_clean.to_csv(cleaned_csv, index=False)
+    print(f"\n✅ Saved {len(df_clean)} cleaned posts to {cleaned_csv}")
 
-# Save summary
-import json
-with open('reddit_summary_stats.json', 'w') as f:
-    json.dump(summary_stats, f, indent=2)
-    
-print("\n📊 Summary stats saved to reddit_summary_stats.json")
\ No newline at end of file
+    # Summary statistics for comparison
+    summary_stats = {
+        'total_posts': len(df_clean),
+        'avg_hourly_rate': hourly.mean() if 'hourly_rate' in df_clean.columns else None,
+        'median_hourly_rate': hourly.median() if 'hourly_rate' in df_clean.columns else None,
+        'min_wage': min_wage,
+        'pct_below_min_wage': (hourly < min_wage).mean() * 100 if 'hourly_rate' in df_clean.columns else None,
+        'avg_hours_worked': hours.mean() if 'hours_worked' in df_clean.columns else None
+    }
+
+    # Save summary
+    with open(summary_json, 'w') as f:
+        json.dump(summary_stats, f, indent=2)
+
+    print(f"\n📊 Summary stats saved to {summary_json}")
+    return summary_stats
+
+if __name__ == "__main__":
+    import sys
+    from gig_analysis import main
+    sys.exit(main(['reddit-validate']))
@@ -0,0 +1,131 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+import tlc_downloader
+from gig_analysis import REPO_ROOT, latest_raw_csv, load_config, main, positive_int, year_month
+
+HEAVY_MODULES = ('pandas', 'pyarrow', 'matplotlib', 'seaborn', 'praw')
+
+
+@pytest.fixture
+def requested_months(monkeypatch):
+    """Capture the months nyc-download would fetch, without any network"""
+    calls = []
+
+    def fake_download_months(self, months):
+        calls.append(months)
+        return {m: 'skipped' for m in months}
+
+    monkeypatch.setattr(tlc_downloader.TLCDownloader, 'download_months', fake_download_months)
+    return calls
+
+
+def test_year_month_accepts_valid_month():
+    assert year_month('2024-07') == '2024-07'
+
+
+@pytest.mark.parametrize('value', ['2024-13', '2024-00', '2024-1x', '24-01', '2024-1', '2024/01'])
+def test_year_month_rejects_bad_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        year_month(value)
+
+
+@pytest.mark.parametrize('value', ['0', '-1', 'x'])
+def test_positive_int_rejects_bad_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+def test_end_without_start_is_an_error(requested_months):
+    with pytest.raises(SystemExit) as exc:
+        main(['nyc-download', '--end', '2024-01'])
+    assert exc.value.code == 2
+    assert requested_months == []
+
+
+def test_reversed_range_is_an_error(requested_months):
+    with pytest.raises(SystemExit) as exc:
+        main(['nyc-download', '--start', '2024-12', '--end', '2024-01'])
+    assert exc.value.code == 2
+    assert requested_months == []
+
+
+def test_command_line_months_replace_configured_list(requested_months):
+    assert main(['nyc-download', '--start', '2024-11', '--end', '2025-01']) == 0
+    assert requested_months == [['2024-11', '2024-12', '2025-01']]
+
+
+def test_configured_months_used_without_arguments(requested_months):
+    assert main(['nyc-download']) == 0
+    assert requested_months == [sorted(load_config()['nyc']['download']['months'])]
+
+
+def test_partial_override_merges_and_resolves_paths(tmp_path):
+    override = tmp_path / 'override.json'
+    override.write_text(json.dumps({
+        'min_wage': 20,
+        'nyc': {'data_dir': 'elsewhere/raw', 'summaries_csv': str(tmp_path / 'summaries.csv')}
+    }))
+
+    base = load_config()
+    config = load_config(str(override))
+
+    assert config['min_wage'] == 20
+    # Untouched keys keep their config.json values
+    assert config['nyc']['chunk_size'] == base['nyc']['chunk_size']
+    assert config['reddit'] == base['reddit']
+    # Relative paths resolve against the repo root, absolute ones are kept
+    assert config['nyc']['data_dir'] == os.path.join(REPO_ROOT, 'elsewhere/raw')
+    assert config['nyc']['summaries_csv'] == str(tmp_path / 'summaries.csv')
+    assert config['nyc']['report_png'] == base['nyc']['report_png']
+
+
+def test_process_and_report_stats_use_separate_files():
+    nyc = load_config()['nyc']
+    assert nyc['process_stats_json'] != nyc['report_stats_json']
+
+
+def test_latest_raw_csv_picks_newest_timestamp(tmp_path):
+    for stamp in ['20250727_193003', '20251001_080000', '20250901_235959']:
+        (tmp_path / f"reddit_earnings_data_{stamp}.csv").write_text('')
+    (tmp_path / 'reddit_earnings_cleaned.csv').write_text('')
+
+    reddit = {'output_dir': str(tmp_path), 'raw_csv_pattern': 'reddit_earnings_data_*.csv'}
+    assert latest_raw_csv(reddit) == str(tmp_path / 'reddit_earnings_data_20251001_080000.csv')
+
+    reddit['output_dir'] = str(tmp_path / 'missing')
+    assert latest_raw_csv(reddit) is None
+
+
+def test_nyc_process_reports_missing_data_dir(tmp_path, capsys):
+    override = tmp_path / 'override.json'
+    override.write_text(json.dumps({'nyc': {'data_dir': str(tmp_path / 'missing')}}))
+
+    assert main(['--config', str(override), 'nyc-process']) == 1
+    assert 'nyc-download' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('argv', [['--help'], ['config'], ['nyc-download', '--help']])
+def test_light_commands_skip_heavy_imports(argv):
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {SRC_DIR!r})\n"
+        "import gig_analysis\n"
+        "try:\n"
+        f"    gig_analysis.main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules), file=sys.stderr)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stderr.strip().splitlines()[-1] == '[]'
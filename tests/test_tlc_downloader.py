@@ -0,0 +1,165 @@
+import http.server
+import os
+import struct
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tlc_downloader
+from tlc_downloader import TLCDownloader, verify_parquet
+
+PAYLOAD = b'PAR1' + os.urandom(50_000) + struct.pack('<I', 100) + b'PAR1'
+CUT_AFTER = 1000
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """Local stand-in for the TLC CDN, configured through class attributes"""
+    payload = PAYLOAD
+    drop_first = False      # close the first full GET after CUT_AFTER bytes
+    honor_range = True      # answer Range requests with 206
+    allow_head = True       # answer HEAD, otherwise 405
+    ranges = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        if not self.allow_head:
+            self.send_error(405)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.payload)))
+        self.end_headers()
+
+    def do_GET(self):
+        range_header = self.headers.get('Range')
+        self.ranges.append(range_header)
+
+        if range_header is not None and self.honor_range:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            if start >= len(self.payload):
+                self.send_error(416)
+                return
+            body = self.payload[start:]
+            self.send_response(206)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Content-Range', f"bytes {start}-{len(self.payload) - 1}/{len(self.payload)}")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.payload)))
+        self.end_headers()
+        if self.drop_first and len(self.ranges) == 1:
+            # Promise the whole file, then drop the connection early
+            self.wfile.write(self.payload[:CUT_AFTER])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(self.payload)
+
+
+@pytest.fixture
+def server():
+    httpd = None
+
+    def start(**settings):
+        nonlocal httpd
+        handler = type('Handler', (StubHandler,), dict(settings, ranges=[]))
+        httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{httpd.server_port}", handler
+
+    yield start
+    if httpd is not None:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def make_downloader(data_dir, base_url, workers=1):
+    return TLCDownloader(str(data_dir), base_url, 'fhvhv_tripdata', workers, retry_delay=0)
+
+
+def test_retry_resumes_dropped_transfer(server, tmp_path):
+    url, handler = server(drop_first=True)
+    downloader = make_downloader(tmp_path, url)
+
+    assert downloader.download_month('2024-01') == ('2024-01', 'downloaded')
+    assert handler.ranges == [None, f"bytes={CUT_AFTER}-"]
+
+    final_path = tmp_path / 'fhvhv_tripdata_2024-01.parquet'
+    assert final_path.read_bytes() == PAYLOAD
+    assert not os.path.exists(str(final_path) + '.part')
+
+
+def test_head_failure_keeps_verified_local_file(tmp_path):
+    final_path = tmp_path / 'fhvhv_tripdata_2024-01.parquet'
+    final_path.write_bytes(PAYLOAD)
+
+    # Nothing listens on port 9 here, so every HEAD fails
+    downloader = make_downloader(tmp_path, 'http://127.0.0.1:9')
+
+    assert verify_parquet(str(final_path))
+    assert downloader.download_months(['2024-01']) == {'2024-01': 'skipped'}
+
+
+def test_corrupt_payload_is_discarded(server, tmp_path):
+    url, handler = server(payload=b'XXXX' + PAYLOAD[4:])
+    downloader = make_downloader(tmp_path, url)
+
+    assert downloader.download_month('2024-01') == ('2024-01', 'failed')
+    assert len(handler.ranges) == downloader.retries
+    assert os.listdir(tmp_path) == []
+
+
+def test_ignored_range_rewrites_part_file(server, tmp_path):
+    url, handler = server(honor_range=False)
+    part_path = tmp_path / 'fhvhv_tripdata_2024-01.parquet.part'
+    part_path.write_bytes(b'stale bytes')
+    downloader = make_downloader(tmp_path, url)
+
+    assert downloader.download_month('2024-01') == ('2024-01', 'downloaded')
+    assert handler.ranges == ["bytes=11-"]
+    assert (tmp_path / 'fhvhv_tripdata_2024-01.parquet').read_bytes() == PAYLOAD
+
+
+def test_rejected_head_still_downloads(server, tmp_path):
+    url, handler = server(allow_head=False)
+    downloader = make_downloader(tmp_path, url)
+
+    assert downloader.download_month('2024-01') == ('2024-01', 'downloaded')
+    assert handler.ranges == [None]
+    assert (tmp_path / 'fhvhv_tripdata_2024-01.parquet').read_bytes() == PAYLOAD
+
+
+def test_complete_part_file_survives_416(server, tmp_path):
+    url, handler = server(allow_head=False)
+    (tmp_path / 'fhvhv_tripdata_2024-01.parquet.part').write_bytes(PAYLOAD)
+    downloader = make_downloader(tmp_path, url)
+
+    assert downloader.download_month('2024-01') == ('2024-01', 'downloaded')
+    assert handler.ranges == [f"bytes={len(PAYLOAD)}-"]
+    assert (tmp_path / 'fhvhv_tripdata_2024-01.parquet').read_bytes() == PAYLOAD
+
+
+def test_download_months_concurrently(server, tmp_path):
+    url, handler = server()
+    months = ['2024-01', '2024-02', '2024-03', '2024-04']
+    downloader = make_downloader(tmp_path, url, workers=3)
+
+    assert downloader.download_months(months) == {m: 'downloaded' for m in months}
+    assert sorted(os.listdir(tmp_path)) == [f"fhvhv_tripdata_{m}.parquet" for m in months]
+
+
+def test_no_backoff_after_last_attempt(monkeypatch, tmp_path):
+    sleeps = []
+    monkeypatch.setattr(tlc_downloader.time, 'sleep', sleeps.append)
+    downloader = TLCDownloader(str(tmp_path), 'http://127.0.0.1:9', 'fhvhv_tripdata', 1,
+                               retries=3, retry_delay=5)
+
+    assert downloader.download_month('2024-01') == ('2024-01', 'failed')
+    assert sleeps == [5, 10]